@@ -11,6 +11,7 @@ Architecture notes:
     - The anchor_account holds all ASAs on behalf of citizens
     - Citizens do NOT need Algorand wallets; ownership is tracked via metadata
     - ASA note field contains JSON metadata following the "bhulekhchain-v1" standard
+      (or, opt-in, a compact msgpack encoding of it -- see decode_title_note)
     - The anchor_account has manager/reserve/freeze/clawback roles on every ASA
     - Freeze is used when a property is disputed or under court order
     - Ownership transfers are recorded as 0-amount self-transfers with updated notes
@@ -19,23 +20,248 @@ Verification flow:
     1. Citizen visits verify.bhulekhchain.gov.in/{property_id}
     2. Backend looks up ASA ID from property_id
     3. Backend queries Algorand Indexer for ASA creation tx + all transfer txs
+       (fetch_title_histories batches these over one pooled connection)
     4. Frontend displays full ownership history from ASA transaction notes
     5. Citizen can independently verify via any Algorand block explorer
 """
 
+import asyncio
+import base64
 import json
-from typing import Any
+from collections.abc import Sequence
+from typing import Any, Literal, NamedTuple
 
+import httpx
+import msgpack
+import orjson
 from algokit_utils import AlgorandClient, AssetCreateParams, AssetTransferParams
 
+# The constant parts of each "bhulekhchain-v1" note are serialized once at
+# import time; per call only the variable fields go through orjson, which
+# emits compact JSON straight to bytes.
+# Key order matches the original dict-based notes, so for ASCII values the
+# bytes written to chain are unchanged; non-ASCII text is now written as raw
+# UTF-8 rather than \u escapes (both decode to the same JSON).
+_TITLE_NOTE_PREFIX = b'{"standard":"bhulekhchain-v1","property_id":'
+_TITLE_NOTE_SUFFIX = b',"type":"TITLE_CERTIFICATE"}'
+_TRANSFER_NOTE_PREFIX = b'{"standard":"bhulekhchain-v1","action":"OWNERSHIP_TRANSFER","asa_id":'
+
+# Compact msgpack note layout ("bh1"): single-letter keys and short type
+# tags for the same fields as the JSON notes. Typically 30-40% smaller,
+# which matters for the 1 KB note limit and indexer payload sizes.
+NoteFormat = Literal["json", "msgpack"]
+_MSGPACK_STANDARD = "bh1"
+_MSGPACK_TYPES: dict[str, tuple[str, str]] = {
+    # tag -> (JSON key holding the type, JSON type value)
+    "TC": ("type", "TITLE_CERTIFICATE"),
+    "OT": ("action", "OWNERSHIP_TRANSFER"),
+}
+_MSGPACK_KEYS: dict[str, str] = {
+    "p": "property_id",
+    "o": "owner_hash",
+    "f": "fabric_tx_id",
+    "d": "document_hash",
+    "a": "asa_id",
+    "po": "previous_owner_hash",
+    "no": "new_owner_hash",
+}
+
+# Title ASA naming: asset names are "TITLE-" plus the (truncated) property
+# ID, and each ASA's url points at its public verification page.
+_ASSET_NAME_PREFIX = "TITLE-"
+_VERIFY_URL_PREFIX = "https://verify.bhulekhchain.gov.in/"
+
+# Algorand allows at most 16 transactions in a single atomic group.
+MAX_GROUP_SIZE = 16
+
+# Default cap on in-flight mints for create_title_certificates_async.
+MAX_CONCURRENT_MINTS = 16
+
+# Connection pool for Indexer history lookups. One HTTP/2 connection
+# multiplexes the per-ASA queries of a whole verification batch.
+INDEXER_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=20)
+INDEXER_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+
+# Default cap on in-flight lookups for fetch_title_histories. Matches the
+# pool size, so on HTTP/1.1 Indexers (e.g. localnet's plain-http endpoint)
+# no lookup waits on the pool long enough to hit its timeout.
+MAX_CONCURRENT_LOOKUPS = 20
+
+
+class TitleCertificate(NamedTuple):
+    """Inputs for one title certificate ASA in a batch mint."""
+
+    property_id: str
+    owner_hash: bytes | str
+    fabric_tx_id: str
+    document_hash: bytes | str
+
+
+class TitleTransfer(NamedTuple):
+    """Inputs for one ownership transfer record in a batch transfer."""
+
+    asa_id: int
+    old_owner: bytes | str
+    new_owner: bytes | str
+    transfer_fabric_tx_id: str
+
+
+class TitleHistoryEntry(NamedTuple):
+    """One noted transaction in a title ASA's on-chain history."""
+
+    tx_id: str
+    confirmed_round: int
+    sender: str
+    tx_type: str
+    note: dict[str, Any]
+
+
+def _as_hex(value: bytes | str) -> str:
+    """Return a raw digest as lowercase hex; strings pass through unchanged."""
+    return value.hex() if isinstance(value, bytes) else value
+
+
+def _title_certificate_note(
+    property_id: str,
+    owner_hash: bytes | str,
+    fabric_tx_id: str,
+    document_hash: bytes | str,
+    note_format: NoteFormat = "json",
+) -> bytes:
+    """Build the note for a TITLE_CERTIFICATE ASA creation."""
+    if note_format == "msgpack":
+        return msgpack.packb(
+            {
+                "s": _MSGPACK_STANDARD,
+                "t": "TC",
+                "p": property_id,
+                "o": _as_hex(owner_hash),
+                "f": fabric_tx_id,
+                "d": _as_hex(document_hash),
+            },
+            use_bin_type=True,
+        )
+    return b"".join((
+        _TITLE_NOTE_PREFIX,
+        orjson.dumps(property_id),
+        b',"owner_hash":',
+        orjson.dumps(_as_hex(owner_hash)),
+        b',"fabric_tx_id":',
+        orjson.dumps(fabric_tx_id),
+        b',"document_hash":',
+        orjson.dumps(_as_hex(document_hash)),
+        _TITLE_NOTE_SUFFIX,
+    ))
+
+
+def _ownership_transfer_note(
+    asa_id: int,
+    old_owner: bytes | str,
+    new_owner: bytes | str,
+    transfer_fabric_tx_id: str,
+    note_format: NoteFormat = "json",
+) -> bytes:
+    """Build the note for an OWNERSHIP_TRANSFER record."""
+    if note_format == "msgpack":
+        return msgpack.packb(
+            {
+                "s": _MSGPACK_STANDARD,
+                "t": "OT",
+                "a": asa_id,
+                "po": _as_hex(old_owner),
+                "no": _as_hex(new_owner),
+                "f": transfer_fabric_tx_id,
+            },
+            use_bin_type=True,
+        )
+    return b"".join((
+        _TRANSFER_NOTE_PREFIX,
+        orjson.dumps(asa_id),
+        b',"previous_owner_hash":',
+        orjson.dumps(_as_hex(old_owner)),
+        b',"new_owner_hash":',
+        orjson.dumps(_as_hex(new_owner)),
+        b',"fabric_tx_id":',
+        orjson.dumps(transfer_fabric_tx_id),
+        b"}",
+    ))
+
+
+def _title_asset_create_params(
+    anchor_account: str,
+    property_id: str,
+    owner_hash: bytes | str,
+    fabric_tx_id: str,
+    document_hash: bytes | str,
+    note_format: NoteFormat = "json",
+) -> AssetCreateParams:
+    """Build the AssetCreateParams for a title certificate ASA."""
+    # Property IDs are ASCII by construction ("UP-LKO-001-00123"). Checking
+    # that up front (str.isascii is O(1) in CPython) guarantees characters
+    # and bytes coincide, so the slices below respect Algorand's byte limits
+    # without encoding the ID to measure it.
+    if not property_id.isascii():
+        raise ValueError(f"Property ID must be ASCII: {property_id!r}")
+
+    note = _title_certificate_note(
+        property_id, owner_hash, fabric_tx_id, document_hash, note_format
+    )
+
+    # Asset name is truncated to 32 bytes (Algorand limit)
+    # Unit name is truncated to 8 bytes (Algorand limit)
+    asset_name = _ASSET_NAME_PREFIX + property_id[:20]
+    unit_name = "BKTITLE"
+    url = _VERIFY_URL_PREFIX + property_id
+
+    return AssetCreateParams(
+        sender=anchor_account,
+        total=1,
+        decimals=0,
+        asset_name=asset_name,
+        unit_name=unit_name,
+        url=url,
+        note=note,
+        manager=anchor_account,
+        reserve=anchor_account,
+        freeze=anchor_account,
+        clawback=anchor_account,
+        default_frozen=False,
+    )
+
+
+def _title_transfer_params(
+    anchor_account: str,
+    asa_id: int,
+    old_owner: bytes | str,
+    new_owner: bytes | str,
+    transfer_fabric_tx_id: str,
+    note_format: NoteFormat = "json",
+) -> AssetTransferParams:
+    """Build the 0-amount self-transfer params recording an ownership change."""
+    note = _ownership_transfer_note(
+        asa_id, old_owner, new_owner, transfer_fabric_tx_id, note_format
+    )
+
+    # Send a 0-amount ASA transfer from anchor_account to itself.
+    # The actual ownership semantics are encoded in the note field.
+    # This creates a permanent, publicly verifiable record of the transfer.
+    return AssetTransferParams(
+        sender=anchor_account,
+        receiver=anchor_account,
+        asset_id=asa_id,
+        amount=0,
+        note=note,
+    )
+
 
 def create_title_certificate_asa(
     algorand: AlgorandClient,
     anchor_account: str,
     property_id: str,
-    owner_hash: str,
+    owner_hash: bytes | str,
     fabric_tx_id: str,
-    document_hash: str,
+    document_hash: bytes | str,
+    note_format: NoteFormat = "json",
 ) -> int:
     """
     Create an ASA representing a title certificate for a registered property.
@@ -61,47 +287,34 @@ def create_title_certificate_asa(
                         (e.g., "UP-LKO-001-00123").
         owner_hash:    SHA-256 hash of the owner's Aadhaar number. PII is
                         never stored on public chains -- only hashed identifiers.
+                        Either a hex string or the raw 32-byte digest (e.g.
+                        from hashlib.sha256(...).digest()), which is
+                        hex-encoded once when the note is built.
         fabric_tx_id:  The Hyperledger Fabric transaction ID that registered
                         or transferred this property.
         document_hash: IPFS CID or SHA-256 hash of the sale deed / registration
-                        document stored on IPFS.
+                        document stored on IPFS. Raw digest bytes are
+                        hex-encoded like owner_hash.
+        note_format:   "json" (default) for the bhulekhchain-v1 JSON note,
+                        or "msgpack" for the compact "bh1" encoding. Use
+                        decode_title_note to read either back.
 
     Returns:
         The ASA ID (int) of the newly created title certificate asset.
 
     Raises:
+        ValueError: If property_id contains non-ASCII characters.
         Exception: If the Algorand transaction fails (insufficient balance,
                    network error, etc.).
     """
-    note: dict[str, Any] = {
-        "standard": "bhulekhchain-v1",
-        "property_id": property_id,
-        "owner_hash": owner_hash,
-        "fabric_tx_id": fabric_tx_id,
-        "document_hash": document_hash,
-        "type": "TITLE_CERTIFICATE",
-    }
-
-    # Asset name is truncated to 32 bytes (Algorand limit)
-    # Unit name is truncated to 8 bytes (Algorand limit)
-    asset_name = f"TITLE-{property_id[:20]}"
-    unit_name = "BKTITLE"
-    url = f"https://verify.bhulekhchain.gov.in/{property_id}"
-
     result = algorand.send.asset_create(
-        AssetCreateParams(
-            sender=anchor_account,
-            total=1,
-            decimals=0,
-            asset_name=asset_name,
-            unit_name=unit_name,
-            url=url,
-            note=json.dumps(note, separators=(",", ":")).encode("utf-8"),
-            manager=anchor_account,
-            reserve=anchor_account,
-            freeze=anchor_account,
-            clawback=anchor_account,
-            default_frozen=False,
+        _title_asset_create_params(
+            anchor_account,
+            property_id,
+            owner_hash,
+            fabric_tx_id,
+            document_hash,
+            note_format,
         )
     )
 
@@ -113,9 +326,10 @@ def transfer_title_asa(
     algorand: AlgorandClient,
     anchor_account: str,
     asa_id: int,
-    old_owner: str,
-    new_owner: str,
+    old_owner: bytes | str,
+    new_owner: bytes | str,
     transfer_fabric_tx_id: str,
+    note_format: NoteFormat = "json",
 ) -> str:
     """
     Record a title ownership transfer on Algorand.
@@ -137,10 +351,14 @@ def transfer_title_asa(
         asa_id:                The ASA ID of the title certificate to transfer.
         old_owner:             SHA-256 hash of the previous owner's Aadhaar.
                                 Recorded in the note for audit trail purposes.
+                                Hex string or raw digest bytes.
         new_owner:             SHA-256 hash of the new owner's Aadhaar.
+                                Hex string or raw digest bytes.
         transfer_fabric_tx_id: The Hyperledger Fabric transaction ID for the
                                 ownership transfer that was executed on the
                                 core ledger.
+        note_format:           "json" (default) or "msgpack"; see
+                                create_title_certificate_asa.
 
     Returns:
         The Algorand transaction ID (str) of the transfer record.
@@ -148,27 +366,383 @@ def transfer_title_asa(
     Raises:
         Exception: If the Algorand transaction fails.
     """
-    note: dict[str, Any] = {
-        "standard": "bhulekhchain-v1",
-        "action": "OWNERSHIP_TRANSFER",
-        "asa_id": asa_id,
-        "previous_owner_hash": old_owner,
-        "new_owner_hash": new_owner,
-        "fabric_tx_id": transfer_fabric_tx_id,
-    }
-
-    # Send a 0-amount ASA transfer from anchor_account to itself.
-    # The actual ownership semantics are encoded in the note field.
-    # This creates a permanent, publicly verifiable record of the transfer.
     result = algorand.send.asset_transfer(
-        AssetTransferParams(
-            sender=anchor_account,
-            receiver=anchor_account,
-            asset_id=asa_id,
-            amount=0,
-            note=json.dumps(note, separators=(",", ":")).encode("utf-8"),
+        _title_transfer_params(
+            anchor_account,
+            asa_id,
+            old_owner,
+            new_owner,
+            transfer_fabric_tx_id,
+            note_format,
         )
     )
 
     tx_id: str = result.tx_id
     return tx_id
+
+
+def create_title_certificates_batch(
+    algorand: AlgorandClient,
+    anchor_account: str,
+    certificates: Sequence[TitleCertificate],
+    note_format: NoteFormat = "json",
+) -> list[int]:
+    """
+    Create title certificate ASAs for many properties in atomic groups.
+
+    Each group holds up to MAX_GROUP_SIZE asset creations and is confirmed
+    in a single round, so registering N properties waits on
+    ceil(N / 16) rounds instead of N. Every ASA is configured exactly as in
+    create_title_certificate_asa.
+
+    Groups are atomic individually, not across the whole batch: if a later
+    group fails, ASAs from earlier groups have already been created. Every
+    certificate is validated before the first group is sent, though, so
+    invalid input creates no ASAs at all.
+
+    Args:
+        algorand:       An initialized AlgorandClient instance.
+        anchor_account: The Algorand address of the BhulekhChain anchor
+                        account that manages all title ASAs.
+        certificates:   The properties to mint certificates for.
+        note_format:    "json" (default) or "msgpack"; see
+                        create_title_certificate_asa.
+
+    Returns:
+        The ASA IDs of the created certificates, in input order.
+
+    Raises:
+        ValueError: If any property_id contains non-ASCII characters.
+        Exception: If any group transaction fails.
+    """
+    params = [
+        _title_asset_create_params(
+            anchor_account,
+            cert.property_id,
+            cert.owner_hash,
+            cert.fabric_tx_id,
+            cert.document_hash,
+            note_format,
+        )
+        for cert in certificates
+    ]
+    asset_ids: list[int] = []
+    for start in range(0, len(params), MAX_GROUP_SIZE):
+        group = algorand.new_group()
+        for create_params in params[start:start + MAX_GROUP_SIZE]:
+            group.add_asset_create(create_params)
+        result = group.send()
+        asset_ids.extend(c["asset-index"] for c in result.confirmations)
+    return asset_ids
+
+
+def transfer_titles_batch(
+    algorand: AlgorandClient,
+    anchor_account: str,
+    transfers: Sequence[TitleTransfer],
+    note_format: NoteFormat = "json",
+) -> list[str]:
+    """
+    Record many title ownership transfers in atomic groups.
+
+    Batched counterpart of transfer_title_asa: up to MAX_GROUP_SIZE
+    transfer records are submitted per group and confirmed in one round.
+    As with create_title_certificates_batch, atomicity holds per group only,
+    and every transfer record is built before the first group is sent.
+
+    Args:
+        algorand:       An initialized AlgorandClient instance.
+        anchor_account: The Algorand address of the BhulekhChain anchor
+                        account.
+        transfers:      The ownership transfers to record.
+        note_format:    "json" (default) or "msgpack"; see
+                        create_title_certificate_asa.
+
+    Returns:
+        The Algorand transaction IDs of the transfer records, in input order.
+
+    Raises:
+        Exception: If any group transaction fails.
+    """
+    params = [
+        _title_transfer_params(
+            anchor_account,
+            transfer.asa_id,
+            transfer.old_owner,
+            transfer.new_owner,
+            transfer.transfer_fabric_tx_id,
+            note_format,
+        )
+        for transfer in transfers
+    ]
+    tx_ids: list[str] = []
+    for start in range(0, len(params), MAX_GROUP_SIZE):
+        group = algorand.new_group()
+        for transfer_params in params[start:start + MAX_GROUP_SIZE]:
+            group.add_asset_transfer(transfer_params)
+        result = group.send()
+        tx_ids.extend(result.tx_ids)
+    return tx_ids
+
+
+async def create_title_certificate_asa_async(
+    algorand: AlgorandClient,
+    anchor_account: str,
+    property_id: str,
+    owner_hash: bytes | str,
+    fabric_tx_id: str,
+    document_hash: bytes | str,
+    note_format: NoteFormat = "json",
+) -> int:
+    """
+    Async variant of create_title_certificate_asa for ASGI callers.
+
+    algokit_utils only exposes a blocking send API, so note encoding,
+    submission and the confirmation wait run on a worker thread via
+    asyncio.to_thread, leaving the event loop free to serve other
+    registration requests in the meantime.
+
+    Args:
+        Same as create_title_certificate_asa.
+
+    Returns:
+        The ASA ID (int) of the newly created title certificate asset.
+
+    Raises:
+        Exception: If the Algorand transaction fails.
+    """
+    return await asyncio.to_thread(
+        create_title_certificate_asa,
+        algorand,
+        anchor_account,
+        property_id,
+        owner_hash,
+        fabric_tx_id,
+        document_hash,
+        note_format,
+    )
+
+
+async def create_title_certificates_async(
+    algorand: AlgorandClient,
+    anchor_account: str,
+    certificates: Sequence[TitleCertificate],
+    note_format: NoteFormat = "json",
+    max_concurrency: int = MAX_CONCURRENT_MINTS,
+) -> list[int]:
+    """
+    Mint title certificate ASAs concurrently, one transaction per property.
+
+    Unlike create_title_certificates_batch, each mint is independent: a
+    failure affects only its own property. At most max_concurrency mints
+    are in flight at once.
+
+    Args:
+        algorand:        An initialized AlgorandClient instance.
+        anchor_account:  The Algorand address of the BhulekhChain anchor
+                         account that manages all title ASAs.
+        certificates:    The properties to mint certificates for.
+        note_format:     "json" (default) or "msgpack"; see
+                         create_title_certificate_asa.
+        max_concurrency: Upper bound on concurrently submitted mints
+                         (at least 1).
+
+    Returns:
+        The ASA IDs of the created certificates, in input order.
+
+    Raises:
+        ValueError: If max_concurrency is less than 1.
+        Exception: The first mint failure. Other mints keep running to
+                   completion and are not rolled back.
+    """
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def mint(cert: TitleCertificate) -> int:
+        async with semaphore:
+            return await create_title_certificate_asa_async(
+                algorand,
+                anchor_account,
+                cert.property_id,
+                cert.owner_hash,
+                cert.fabric_tx_id,
+                cert.document_hash,
+                note_format,
+            )
+
+    return list(await asyncio.gather(*(mint(cert) for cert in certificates)))
+
+
+def decode_title_note(note: bytes) -> dict[str, Any]:
+    """
+    Decode a title ASA note written in either supported format.
+
+    JSON notes are returned as parsed. Compact msgpack ("bh1") notes are
+    expanded to the same field names and values as their JSON
+    equivalent, so verifiers can handle both formats with one code path.
+
+    Args:
+        note: The raw note bytes from an ASA creation or transfer
+              transaction (base64-decoded from the Indexer response).
+
+    Returns:
+        The note as a "bhulekhchain-v1" metadata dict.
+
+    Raises:
+        ValueError: If the note is not a recognised BhulekhChain note.
+    """
+    if note[:1] == b"{":
+        try:
+            decoded = json.loads(note)
+        except ValueError as exc:
+            raise ValueError("Note is not valid JSON") from exc
+        if not isinstance(decoded, dict) or decoded.get("standard") != "bhulekhchain-v1":
+            raise ValueError("Note is not a BhulekhChain 'bhulekhchain-v1' JSON note")
+        return decoded
+
+    try:
+        packed = msgpack.unpackb(note, raw=False)
+    except (ValueError, msgpack.UnpackException) as exc:
+        raise ValueError("Note is neither JSON nor msgpack") from exc
+    if not isinstance(packed, dict) or packed.get("s") != _MSGPACK_STANDARD:
+        raise ValueError("Note is not a BhulekhChain 'bh1' msgpack note")
+    if packed.get("t") not in _MSGPACK_TYPES:
+        raise ValueError(f"Unknown BhulekhChain note type: {packed.get('t')!r}")
+
+    type_key, type_value = _MSGPACK_TYPES[packed["t"]]
+    decoded: dict[str, Any] = {"standard": "bhulekhchain-v1", type_key: type_value}
+    for short_key, value in packed.items():
+        if short_key in _MSGPACK_KEYS:
+            decoded[_MSGPACK_KEYS[short_key]] = value
+    return decoded
+
+
+def create_indexer_client(indexer_url: str) -> httpx.AsyncClient:
+    """
+    Create a pooled HTTP/2 client for Algorand Indexer history lookups.
+
+    Share one client across a verification batch (or a service's lifetime)
+    so TCP/TLS setup is paid once rather than per ASA. The caller owns the
+    client and must close it, e.g. with ``async with``.
+
+    Args:
+        indexer_url: Base URL of the Algorand Indexer API.
+
+    Returns:
+        An httpx.AsyncClient bound to the Indexer.
+    """
+    return httpx.AsyncClient(
+        base_url=indexer_url,
+        http2=True,
+        limits=INDEXER_LIMITS,
+        timeout=INDEXER_TIMEOUT,
+    )
+
+
+async def fetch_title_history(
+    client: httpx.AsyncClient,
+    asa_id: int,
+    anchor_account: str,
+) -> list[TitleHistoryEntry]:
+    """
+    Fetch the ownership history of one title ASA from the Indexer.
+
+    Reads every transaction for the ASA (following pagination) and decodes
+    its note, giving the creation record followed by each ownership
+    transfer in chronological order. Only transactions sent by the anchor
+    account count: anyone can attach a note to an opt-in or transfer of
+    the ASA, so transactions from other senders are skipped, as are
+    transactions without a note or with a note that is not a recognised
+    BhulekhChain note.
+
+    Args:
+        client:         An Indexer client from create_indexer_client.
+        asa_id:         The ASA ID of the title certificate.
+        anchor_account: The Algorand address of the BhulekhChain anchor
+                        account that created the ASA.
+
+    Returns:
+        The anchor account's noted transactions for the ASA, oldest first.
+
+    Raises:
+        httpx.HTTPStatusError: If the Indexer returns an error response.
+    """
+    history: list[TitleHistoryEntry] = []
+    params: dict[str, str] = {}
+    while True:
+        response = await client.get(f"/v2/assets/{asa_id}/transactions", params=params)
+        response.raise_for_status()
+        page = response.json()
+        for txn in page.get("transactions", []):
+            if txn["sender"] != anchor_account or "note" not in txn:
+                continue
+            try:
+                note = decode_title_note(base64.b64decode(txn["note"]))
+            except ValueError:
+                continue
+            history.append(
+                TitleHistoryEntry(
+                    tx_id=txn["id"],
+                    confirmed_round=txn["confirmed-round"],
+                    sender=txn["sender"],
+                    tx_type=txn["tx-type"],
+                    note=note,
+                )
+            )
+        next_token = page.get("next-token")
+        if not next_token or not page.get("transactions"):
+            return history
+        params = {"next": next_token}
+
+
+async def fetch_title_histories(
+    asa_ids: Sequence[int],
+    anchor_account: str,
+    client: httpx.AsyncClient | None = None,
+    indexer_url: str | None = None,
+    max_concurrency: int = MAX_CONCURRENT_LOOKUPS,
+) -> dict[int, list[TitleHistoryEntry]]:
+    """
+    Fetch the ownership histories of many title ASAs concurrently.
+
+    All lookups share one pooled HTTP/2 connection to the Indexer. Pass
+    either a long-lived client from create_indexer_client, to also reuse
+    the connection across batches, or an indexer_url, in which case a
+    client is created and closed for this call. At most max_concurrency
+    lookups are in flight at once.
+
+    Args:
+        asa_ids:         The ASA IDs of the title certificates to verify.
+        anchor_account:  The Algorand address of the BhulekhChain anchor
+                         account; see fetch_title_history.
+        client:          A shared Indexer client.
+        indexer_url:     Base URL of the Algorand Indexer API.
+        max_concurrency: Upper bound on concurrent ASA lookups (at least 1).
+
+    Returns:
+        Mapping of ASA ID to its history, oldest entry first.
+
+    Raises:
+        ValueError: If both or neither of client and indexer_url are given,
+                    or if max_concurrency is less than 1.
+        httpx.HTTPStatusError: If the Indexer returns an error response.
+    """
+    if (client is None) == (indexer_url is None):
+        raise ValueError("Pass exactly one of client or indexer_url")
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+    if client is None:
+        async with create_indexer_client(indexer_url) as owned_client:
+            return await fetch_title_histories(
+                asa_ids, anchor_account, owned_client, max_concurrency=max_concurrency
+            )
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def lookup(asa_id: int) -> list[TitleHistoryEntry]:
+        async with semaphore:
+            return await fetch_title_history(client, asa_id, anchor_account)
+
+    histories = await asyncio.gather(*(lookup(asa_id) for asa_id in asa_ids))
+    return dict(zip(asa_ids, histories))
@@ -5,6 +5,8 @@ Usage:
     python scripts/deploy.py --network localnet
     python scripts/deploy.py --network testnet
     python scripts/deploy.py --network mainnet
+    python scripts/deploy.py --network localnet --network testnet
+    python scripts/deploy.py --network all
 
 This script:
     1. Connects to the specified Algorand network
@@ -21,16 +23,23 @@ Prerequisites:
 """
 
 import argparse
+import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 
+import orjson
 from algokit_utils import (
     AlgorandClient,
     AppFactory,
 )
+from algokit_utils.applications.app_client import AppClientMethodCallParams
 from algokit_utils.applications.app_factory import AppFactoryParams, AppFactoryCreateParams
 
+logger = logging.getLogger(__name__)
+
 
 # Network configuration presets
 NETWORK_CONFIG: dict[str, dict[str, str]] = {
@@ -52,6 +61,23 @@ NETWORK_CONFIG: dict[str, dict[str, str]] = {
 }
 
 
+def _spec_rank(path: Path) -> int | None:
+    """
+    Rank a JSON file under artifacts/ as a TitleProofAnchor app spec.
+
+    Lower is preferred: a legacy application.json first, then ARC-56
+    (algokit_utils' native format, a superset of ARC-32), then ARC-32.
+    Returns None for files that are not a TitleProofAnchor spec.
+    """
+    if path.name == "application.json" and path.parent.name == "TitleProofAnchor":
+        return 0
+    if path.name == "TitleProofAnchor.arc56.json":
+        return 1
+    if path.name == "TitleProofAnchor.arc32.json":
+        return 2
+    return None
+
+
 def get_app_spec_path() -> Path:
     """
     Locate the compiled ARC-32/ARC-56 application specification JSON.
@@ -65,25 +91,70 @@ def get_app_spec_path() -> Path:
     Raises:
         FileNotFoundError: If the compiled spec is not found.
     """
-    project_root = Path(__file__).parent.parent
-    # algokit compile outputs to artifacts/ by default
-    candidates = [
-        project_root / "artifacts" / "TitleProofAnchor" / "application.json",
-        project_root / "artifacts" / "title_proof" / "TitleProofAnchor.arc32.json",
-        project_root / "artifacts" / "TitleProofAnchor.arc32.json",
-        project_root / "artifacts" / "TitleProofAnchor" / "TitleProofAnchor.arc56.json",
-    ]
-    for candidate in candidates:
-        if candidate.exists():
-            return candidate
+    artifacts_dir = Path(__file__).parent.parent / "artifacts"
+    # algokit compile outputs to artifacts/ by default. Scan it once and pick
+    # the preferred spec format rather than probing each known layout.
+    ranked = sorted(
+        (rank, path)
+        for path in artifacts_dir.glob("**/*.json")
+        if (rank := _spec_rank(path)) is not None
+    )
+    if ranked:
+        return ranked[0][1]
 
     raise FileNotFoundError(
-        f"Compiled application spec not found. Searched:\n"
-        + "\n".join(f"  - {c}" for c in candidates)
-        + "\n\nRun 'algokit compile py contracts/title_proof.py' first."
+        f"Compiled application spec not found under {artifacts_dir}.\n"
+        "Expected TitleProofAnchor/application.json, TitleProofAnchor.arc56.json "
+        "or TitleProofAnchor.arc32.json.\n"
+        "\nRun 'algokit compile py contracts/title_proof.py' first."
     )
 
 
+@lru_cache(maxsize=4)
+def _load_spec(path: str, mtime_ns: int) -> str:
+    """
+    Read the application specification, cached per file path and mtime.
+
+    Repeated deployments in the same process (CI matrices, integration
+    tests) reuse the loaded spec. Keying on ``mtime_ns`` means a recompiled
+    spec is picked up without any explicit cache invalidation.
+
+    The spec is round-tripped through orjson so AppFactory receives a
+    compact, whitespace-free payload, which is cheaper for its internal
+    JSON parse.
+
+    Args:
+        path:     Path to the application specification JSON file.
+        mtime_ns: Modification time of the file, used only as a cache key.
+
+    Returns:
+        The compact JSON content of the specification.
+    """
+    return orjson.dumps(orjson.loads(Path(path).read_bytes())).decode()
+
+
+@lru_cache(maxsize=3)
+def _client_for(network: str) -> AlgorandClient:
+    """
+    Return the AlgorandClient for a network, built once per process.
+
+    Repeated deploys (test loops, a long-lived deploy service) reuse the
+    same client and its account signers. Its suggested params are not
+    reused: deploy() refreshes them on every call.
+
+    Args:
+        network: One of "localnet", "testnet", or "mainnet".
+
+    Returns:
+        The shared AlgorandClient for that network.
+    """
+    if network == "localnet":
+        return AlgorandClient.default_localnet()
+    if network == "testnet":
+        return AlgorandClient.testnet()
+    return AlgorandClient.mainnet()
+
+
 def deploy(network: str) -> int:
     """
     Deploy the TitleProofAnchor contract to the specified network.
@@ -95,42 +166,43 @@ def deploy(network: str) -> int:
         The deployed application ID.
     """
     if network not in NETWORK_CONFIG:
-        print(f"Error: Unknown network '{network}'. Use localnet, testnet, or mainnet.")
+        logger.error("Unknown network '%s'. Use localnet, testnet, or mainnet.", network)
         sys.exit(1)
 
     config = NETWORK_CONFIG[network]
-    print(f"Deploying TitleProofAnchor to {network}...")
-    print(f"  Algod URL: {config['algod_url']}")
+    logger.info("Deploying TitleProofAnchor to %s...", network)
+    logger.info("  Algod URL: %s", config["algod_url"])
 
-    # Initialize Algorand client
-    if network == "localnet":
-        algorand = AlgorandClient.default_localnet()
-    elif network == "testnet":
-        algorand = AlgorandClient.testnet()
-    else:
-        algorand = AlgorandClient.mainnet()
+    # Initialize Algorand client. The shared client would otherwise keep its
+    # suggested params for ~50 minutes, long past the 10-round validity
+    # window on testnet/mainnet, and a repeat localnet deploy would resend
+    # an identical create; fetch fresh params for every deployment.
+    algorand = _client_for(network)
+    algorand.set_suggested_params_cache(algorand.client.algod.suggested_params())
 
     # Get the deployer/anchor account
     if network == "localnet":
         # Use the default localnet dispenser account for local development
         deployer = algorand.account.localnet_dispenser()
-        print(f"  Deployer (localnet dispenser): {deployer.address}")
+        logger.info("  Deployer (localnet dispenser): %s", deployer.address)
     else:
         # For testnet/mainnet, require the mnemonic environment variable
         mnemonic = os.getenv("ALGORAND_ANCHOR_ACCOUNT_MNEMONIC")
         if not mnemonic:
-            print("Error: ALGORAND_ANCHOR_ACCOUNT_MNEMONIC environment variable not set.")
-            print("Set it to the 25-word mnemonic of the anchor/deployer account.")
+            logger.error(
+                "ALGORAND_ANCHOR_ACCOUNT_MNEMONIC environment variable not set. "
+                "Set it to the 25-word mnemonic of the anchor/deployer account."
+            )
             sys.exit(1)
         deployer = algorand.account.from_mnemonic(mnemonic=mnemonic)
-        print(f"  Deployer: {deployer.address}")
+        logger.info("  Deployer: %s", deployer.address)
 
     # Locate the compiled application specification
     app_spec_path = get_app_spec_path()
-    print(f"  App spec: {app_spec_path}")
+    logger.info("  App spec: %s", app_spec_path)
 
     # Load the app spec JSON content (string is treated as JSON, not a path)
-    app_spec_json = app_spec_path.read_text()
+    app_spec_json = _load_spec(str(app_spec_path), app_spec_path.stat().st_mtime_ns)
 
     # Create an AppFactory for the TitleProofAnchor contract
     factory = AppFactory(
@@ -142,41 +214,47 @@ def deploy(network: str) -> int:
     )
 
     # Deploy the application (bare create — no ABI method on creation)
-    print("  Creating application on-chain...")
+    logger.info("  Creating application on-chain...")
     app_client, create_result = factory.send.bare.create(
         AppFactoryCreateParams()
     )
 
     app_id = app_client.app_id
     app_address = app_client.app_address
-    print(f"  Application created successfully!")
-    print(f"  App ID:      {app_id}")
-    print(f"  App Address: {app_address}")
-    print(f"  Create TxID: {create_result.tx_id}")
+    logger.info("  Application created successfully!")
+    logger.info("  App ID:      %s", app_id)
+    logger.info("  App Address: %s", app_address)
+    logger.info("  Create TxID: %s", create_result.tx_id)
 
     # Initialize the contract with the deployer as the anchor authority.
     # In production, this would be a dedicated anchor service account,
     # but for initial deployment the deployer sets itself as authority
     # and can later rotate to a different account.
-    print(f"  Initializing with anchor authority: {deployer.address}")
-    from algokit_utils.applications.app_client import AppClientMethodCallParams
+    #
+    # This cannot share an atomic group with the create transaction: the
+    # app ID is only assigned once the create confirms, and `initialize`
+    # is not an ABI create method (it only accepts NoOp calls on an
+    # existing app), so deployment costs two confirmation rounds.
+    logger.info("  Initializing with anchor authority: %s", deployer.address)
     app_client.send.call(AppClientMethodCallParams(
         method="initialize",
         args=[deployer.address],
     ))
-    print("  Contract initialized successfully!")
-
-    # Print summary
-    print("\n" + "=" * 60)
-    print("  DEPLOYMENT COMPLETE")
-    print("=" * 60)
-    print(f"  Network:          {network}")
-    print(f"  App ID:           {app_id}")
-    print(f"  App Address:      {app_address}")
-    print(f"  Anchor Authority: {deployer.address}")
-    print(f"\n  Set this in your .env file:")
-    print(f"  ALGORAND_APP_ID={app_id}")
-    print("=" * 60)
+    logger.info("  Contract initialized successfully!")
+
+    # Log the summary as a single record so concurrent multi-network
+    # deployments cannot interleave their summaries.
+    rule = "=" * 60
+    logger.info(
+        "\n%s\n  DEPLOYMENT COMPLETE\n%s\n"
+        "  Network:          %s\n"
+        "  App ID:           %s\n"
+        "  App Address:      %s\n"
+        "  Anchor Authority: %s\n"
+        "\n  Set this in your .env file:\n"
+        "  ALGORAND_APP_ID=%s\n%s",
+        rule, rule, network, app_id, app_address, deployer.address, app_id, rule,
+    )
 
     return app_id
 
@@ -190,6 +268,8 @@ def main() -> None:
             "Examples:\n"
             "  python scripts/deploy.py --network localnet\n"
             "  python scripts/deploy.py --network testnet\n"
+            "  python scripts/deploy.py --network localnet --network testnet\n"
+            "  python scripts/deploy.py --network all\n"
             "\n"
             "Environment variables (required for testnet/mainnet):\n"
             "  ALGORAND_ANCHOR_ACCOUNT_MNEMONIC  25-word mnemonic for deployer account\n"
@@ -200,14 +280,68 @@ def main() -> None:
     parser.add_argument(
         "--network",
         type=str,
-        choices=["localnet", "testnet", "mainnet"],
-        default="localnet",
-        help="Target Algorand network (default: localnet)",
+        action="append",
+        choices=[*NETWORK_CONFIG, "all"],
+        help=(
+            "Target Algorand network; repeat to deploy to several networks "
+            "concurrently, or pass 'all' (default: localnet)"
+        ),
     )
 
     args = parser.parse_args()
-    deploy(args.network)
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(message)s",
+        handlers=[logging.StreamHandler(sys.stdout)],
+    )
 
+    networks = args.network or ["localnet"]
+    if "all" in networks:
+        networks = list(NETWORK_CONFIG)
+    # Preserve order while dropping duplicates such as "--network all --network testnet"
+    networks = list(dict.fromkeys(networks))
+
+    # Check configuration up front, so a missing mnemonic fails the run
+    # before any network is deployed rather than partway through a fan-out.
+    remote = [network for network in networks if network != "localnet"]
+    if remote and not os.getenv("ALGORAND_ANCHOR_ACCOUNT_MNEMONIC"):
+        logger.error(
+            "ALGORAND_ANCHOR_ACCOUNT_MNEMONIC environment variable not set "
+            "(required for %s). Set it to the 25-word mnemonic of the "
+            "anchor/deployer account.",
+            ", ".join(remote),
+        )
+        sys.exit(1)
+
+    if len(networks) == 1:
+        deploy(networks[0])
+        return
+
+    # Deployments are dominated by network round-trips, so running them on
+    # threads overlaps the confirmation waits across networks. Each network's
+    # outcome is collected separately, so one failure does not hide the app
+    # IDs of networks that did deploy.
+    app_ids: dict[str, int] = {}
+    failed: list[str] = []
+    with ThreadPoolExecutor(max_workers=len(networks)) as executor:
+        futures = {executor.submit(deploy, network): network for network in networks}
+        for future in as_completed(futures):
+            network = futures[future]
+            try:
+                app_ids[network] = future.result()
+            except (Exception, SystemExit) as exc:
+                # deploy() exits on configuration errors; from a worker thread
+                # that SystemExit is re-raised here like any other failure.
+                logger.error("Deployment to %s failed", network, exc_info=exc)
+                failed.append(network)
+
+    if app_ids:
+        logger.info("\nDeployed application IDs (in order of completion):")
+        for network, app_id in app_ids.items():
+            logger.info("  %s: %s", network, app_id)
+    if failed:
+        logger.error("\nFailed deployments: %s", ", ".join(failed))
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,182 @@
+"""
+Shared pytest fixtures for the BhulekhChain Algorand tests.
+
+The suite can run in parallel with pytest-xdist (``pytest tests/ -n auto``).
+Each xdist worker is a separate process with its own session fixtures, so
+every worker gets its own AlgorandClient, its own funding account and its
+own pool of pre-funded test accounts.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+from algokit_utils import AlgoAmount, AlgorandClient, PaymentParams
+
+from contracts.title_asa import MAX_GROUP_SIZE
+from scripts.deploy import get_app_spec_path
+
+# Resolved app spec location, shared with xdist workers via the environment.
+APP_SPEC_PATH_ENV = "BHULEKH_APP_SPEC_PATH"
+
+# Funding for each pooled test account and for each xdist worker's funder.
+ACCOUNT_FUNDING = AlgoAmount.from_algo(10)
+WORKER_FUNDING = AlgoAmount.from_algo(1_000)
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """
+    Resolve the compiled app spec once for the whole run.
+
+    xdist workers inherit the controller's environment, so the artifacts
+    directory is scanned once per run rather than once per worker. Setting
+    BHULEKH_APP_SPEC_PATH beforehand points the suite at a specific spec.
+    """
+    if APP_SPEC_PATH_ENV in os.environ:
+        return
+    try:
+        os.environ[APP_SPEC_PATH_ENV] = str(get_app_spec_path())
+    except FileNotFoundError:
+        pass  # app_spec_path skips the tests that need the spec
+
+
+class AccountPool:
+    """
+    Pre-funded random accounts handed out to tests one at a time.
+
+    Accounts are created and funded in batches of MAX_GROUP_SIZE (the
+    atomic group limit) with a single group payment, so tests pay one
+    confirmation round per batch instead of one funding round per account.
+    """
+
+    def __init__(self, algorand: AlgorandClient, funder: str) -> None:
+        self._algorand = algorand
+        self._funder = funder
+        self._accounts: list[str] = []
+
+    def take(self) -> str:
+        """Return the address of a funded account not handed out before."""
+        if not self._accounts:
+            self._refill()
+        return self._accounts.pop()
+
+    def _refill(self) -> None:
+        group = self._algorand.new_group()
+        addresses = []
+        for _ in range(MAX_GROUP_SIZE):
+            account = self._algorand.account.random()
+            group.add_payment(
+                PaymentParams(
+                    sender=self._funder,
+                    receiver=account.address,
+                    amount=ACCOUNT_FUNDING,
+                )
+            )
+            addresses.append(account.address)
+        group.send()
+        self._accounts.extend(addresses)
+
+
+@pytest.fixture(scope="session")
+def algorand() -> AlgorandClient:
+    """
+    Create the AlgorandClient connected to localnet, shared by every fixture.
+
+    The algod/indexer clients come from py-algorand-sdk, which issues each
+    request through urllib without a pooled session, so there is no HTTP
+    transport to tune. The client's defaults already suit localnet: cached
+    suggested params are reused across sends, and the validity window is
+    1000 rounds on localnet.
+
+    Confirmation waits need no tuning either: algokit_utils waits via
+    algod's status_after_block long-poll, which returns as soon as the next
+    round is produced rather than sleeping on a fixed interval.
+    """
+    return AlgorandClient.default_localnet()
+
+
+@pytest.fixture(scope="session")
+def app_spec_path() -> Path:
+    """Path of the compiled application specification."""
+    spec_path = os.environ.get(APP_SPEC_PATH_ENV)
+    if spec_path is None:
+        pytest.skip(
+            "Compiled application spec not found. "
+            "Run 'algokit compile py contracts/title_proof.py' first."
+        )
+    return Path(spec_path)
+
+
+@pytest.fixture(scope="session")
+def funder(algorand: AlgorandClient) -> str:
+    """
+    Account that funds this worker's test accounts.
+
+    Without xdist this is the localnet dispenser. Under xdist
+    (PYTEST_XDIST_WORKER is set) each worker gets its own funding account,
+    funded once from the dispenser, so workers never share a sender.
+
+    Returns:
+        The address string of the funding account.
+    """
+    dispenser = algorand.account.localnet_dispenser()
+    if os.environ.get("PYTEST_XDIST_WORKER") is None:
+        return dispenser.address
+
+    account = algorand.account.random()
+    algorand.send.payment(
+        PaymentParams(
+            sender=dispenser.address,
+            receiver=account.address,
+            amount=WORKER_FUNDING,
+        )
+    )
+    return account.address
+
+
+@pytest.fixture(scope="session")
+def worker_account_pool(algorand: AlgorandClient, funder: str) -> AccountPool:
+    """Pool of pre-funded accounts shared by all tests on this worker."""
+    return AccountPool(algorand, funder)
+
+
+@pytest.fixture(scope="class")
+def funded_accounts(worker_account_pool: AccountPool) -> dict[str, str]:
+    """
+    Funded accounts for one test class, keyed by role.
+
+    Class-scoped to match the shared per-class contract deployment. All
+    roles come from the worker's account pool, so a class needing every
+    role still waits on at most one group funding transaction.
+
+    Returns:
+        Addresses for "authority", "unauthorized" and "spare" (e.g. a
+        rotation target).
+    """
+    return {
+        "authority": worker_account_pool.take(),
+        "unauthorized": worker_account_pool.take(),
+        "spare": worker_account_pool.take(),
+    }
+
+
+@pytest.fixture(scope="class")
+def authority_account(funded_accounts: dict[str, str]) -> str:
+    """
+    Funded account to serve as the anchor authority.
+
+    Returns:
+        The address string of the authority account.
+    """
+    return funded_accounts["authority"]
+
+
+@pytest.fixture(scope="class")
+def unauthorized_account(funded_accounts: dict[str, str]) -> str:
+    """
+    Funded account that is NOT the anchor authority.
+
+    Returns:
+        The address string of the unauthorized account.
+    """
+    return funded_accounts["unauthorized"]
@@ -0,0 +1,180 @@
+"""
+Unit tests for app spec discovery and network selection in scripts/deploy.py.
+
+These tests lay out a throwaway artifacts/ directory or replace deploy()
+with a stub; none of them needs a running localnet.
+
+Run with:
+    pytest tests/test_deploy.py -v
+"""
+
+import logging
+import threading
+from pathlib import Path
+
+import pytest
+
+from scripts import deploy
+from scripts.deploy import _spec_rank, get_app_spec_path
+
+LEGACY_SPEC = "TitleProofAnchor/application.json"
+ARC56_SPEC = "TitleProofAnchor/TitleProofAnchor.arc56.json"
+ARC32_SPEC = "TitleProofAnchor/TitleProofAnchor.arc32.json"
+
+
+@pytest.fixture
+def project_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point get_app_spec_path at an empty project directory."""
+    monkeypatch.setattr(deploy, "__file__", str(tmp_path / "scripts" / "deploy.py"))
+    (tmp_path / "artifacts").mkdir()
+    return tmp_path
+
+
+def _write_specs(project_dir: Path, *names: str) -> None:
+    """Create empty spec files under the project's artifacts/ directory."""
+    for name in names:
+        path = project_dir / "artifacts" / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("{}")
+
+
+class TestSpecRank:
+    """Tests for ranking candidate spec files."""
+
+    def test_preference_order(self) -> None:
+        """Verify application.json beats ARC-56, which beats ARC-32."""
+        ranks = [_spec_rank(Path(name)) for name in (LEGACY_SPEC, ARC56_SPEC, ARC32_SPEC)]
+        assert ranks == sorted(ranks)
+        assert len(set(ranks)) == 3
+
+    @pytest.mark.parametrize(
+        "name",
+        ["OtherApp/application.json", "OtherApp.arc56.json", "TitleProofAnchor.json"],
+    )
+    def test_ignores_other_files(self, name: str) -> None:
+        """Verify that files for other apps are not ranked."""
+        assert _spec_rank(Path(name)) is None
+
+
+class TestGetAppSpecPath:
+    """Tests for locating the compiled app spec."""
+
+    @pytest.mark.parametrize(
+        ("present", "expected"),
+        [
+            ((LEGACY_SPEC, ARC56_SPEC, ARC32_SPEC), LEGACY_SPEC),
+            ((ARC56_SPEC, ARC32_SPEC), ARC56_SPEC),
+            ((ARC32_SPEC,), ARC32_SPEC),
+        ],
+    )
+    def test_picks_preferred_spec(
+        self,
+        project_dir: Path,
+        present: tuple[str, ...],
+        expected: str,
+    ) -> None:
+        """Verify that the most preferred spec present is returned."""
+        _write_specs(project_dir, "OtherApp/application.json", *present)
+        assert get_app_spec_path() == project_dir / "artifacts" / expected
+
+    def test_missing_spec(self, project_dir: Path) -> None:
+        """Verify that a missing spec raises FileNotFoundError."""
+        _write_specs(project_dir, "OtherApp/application.json")
+        with pytest.raises(FileNotFoundError, match="Compiled application spec"):
+            get_app_spec_path()
+
+
+class _FakeDeploy:
+    """Stand-in for deploy() that records networks and can fail some of them."""
+
+    def __init__(self) -> None:
+        self.failing: tuple[str, ...] = ()
+        self._lock = threading.Lock()
+        self.networks: list[str] = []
+
+    def __call__(self, network: str) -> int:
+        with self._lock:
+            self.networks.append(network)
+        if network in self.failing:
+            raise SystemExit(1)
+        return 1000 + list(deploy.NETWORK_CONFIG).index(network)
+
+
+@pytest.fixture
+def fake_deploy(monkeypatch: pytest.MonkeyPatch) -> _FakeDeploy:
+    """Replace deploy() with a recording stub and set a deployer mnemonic."""
+    fake = _FakeDeploy()
+    monkeypatch.setattr(deploy, "deploy", fake)
+    monkeypatch.setenv("ALGORAND_ANCHOR_ACCOUNT_MNEMONIC", "test mnemonic")
+    return fake
+
+
+def _run_main(monkeypatch: pytest.MonkeyPatch, *args: str) -> None:
+    """Run deploy.main() with the given command-line arguments."""
+    monkeypatch.setattr("sys.argv", ["deploy.py", *args])
+    deploy.main()
+
+
+class TestMain:
+    """Tests for network selection in the deploy entry point."""
+
+    @pytest.mark.parametrize(
+        ("args", "expected"),
+        [
+            ((), ["localnet"]),
+            (("--network", "testnet"), ["testnet"]),
+            (
+                (
+                    "--network", "testnet",
+                    "--network", "localnet",
+                    "--network", "testnet",
+                ),
+                ["localnet", "testnet"],
+            ),
+            (("--network", "all"), ["localnet", "mainnet", "testnet"]),
+            (
+                ("--network", "all", "--network", "testnet"),
+                ["localnet", "mainnet", "testnet"],
+            ),
+        ],
+    )
+    def test_deploys_each_network_once(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        fake_deploy: _FakeDeploy,
+        args: tuple[str, ...],
+        expected: list[str],
+    ) -> None:
+        """Verify that repeated and 'all' networks are each deployed once."""
+        _run_main(monkeypatch, *args)
+        assert sorted(fake_deploy.networks) == expected
+
+    def test_missing_mnemonic_deploys_nothing(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        fake_deploy: _FakeDeploy,
+    ) -> None:
+        """Verify that a missing mnemonic fails before any network deploys."""
+        monkeypatch.delenv("ALGORAND_ANCHOR_ACCOUNT_MNEMONIC")
+        with pytest.raises(SystemExit):
+            _run_main(monkeypatch, "--network", "all")
+        assert fake_deploy.networks == []
+
+    def test_failure_still_reports_deployed_networks(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        fake_deploy: _FakeDeploy,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Verify that one failed network does not hide the others' app IDs."""
+        fake_deploy.failing = ("testnet",)
+        caplog.set_level(logging.INFO, logger=deploy.logger.name)
+
+        with pytest.raises(SystemExit) as excinfo:
+            _run_main(monkeypatch, "--network", "all")
+
+        assert excinfo.value.code == 1
+        assert sorted(fake_deploy.networks) == ["localnet", "mainnet", "testnet"]
+        assert "localnet: 1000" in caplog.text
+        assert "mainnet: 1002" in caplog.text
+        assert "Failed deployments: testnet" in caplog.text
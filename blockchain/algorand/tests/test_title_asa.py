@@ -0,0 +1,412 @@
+"""
+Unit tests for the title ASA helpers in contracts/title_asa.py.
+
+These tests build and decode notes, send batches through a fake
+AlgorandClient and replay Indexer responses through httpx.MockTransport;
+none of them needs a running localnet.
+
+Run with:
+    pytest tests/test_title_asa.py -v
+"""
+
+import asyncio
+import base64
+import json
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, Final
+
+import httpx
+import pytest
+
+from contracts.title_asa import (
+    MAX_GROUP_SIZE,
+    TitleCertificate,
+    TitleHistoryEntry,
+    TitleTransfer,
+    _ownership_transfer_note,
+    _title_certificate_note,
+    create_title_certificate_asa,
+    create_title_certificates_async,
+    create_title_certificates_batch,
+    decode_title_note,
+    fetch_title_histories,
+    fetch_title_history,
+    transfer_titles_batch,
+)
+
+ANCHOR_ACCOUNT: Final = "ANCHORACCOUNT"
+OTHER_ACCOUNT: Final = "SOMEONEELSE"
+ASA_ID: Final = 1234
+
+OWNER_HASH: Final[bytes] = b"\x01" * 32
+NEW_OWNER_HASH: Final[bytes] = b"\x02" * 32
+DOCUMENT_HASH: Final[bytes] = b"\xab" * 32
+
+
+def _baseline_note(note: dict[str, Any]) -> bytes:
+    """Encode a note the way the original dict-based helpers did."""
+    return json.dumps(note, separators=(",", ":")).encode("utf-8")
+
+
+def _certificate_dict() -> dict[str, Any]:
+    """The expected metadata of the test TITLE_CERTIFICATE note."""
+    return {
+        "standard": "bhulekhchain-v1",
+        "property_id": "MH-PUNE-HAV-001",
+        "owner_hash": OWNER_HASH.hex(),
+        "fabric_tx_id": "fabric-tx-1",
+        "document_hash": DOCUMENT_HASH.hex(),
+        "type": "TITLE_CERTIFICATE",
+    }
+
+
+def _transfer_dict() -> dict[str, Any]:
+    """The expected metadata of the test OWNERSHIP_TRANSFER note."""
+    return {
+        "standard": "bhulekhchain-v1",
+        "action": "OWNERSHIP_TRANSFER",
+        "asa_id": ASA_ID,
+        "previous_owner_hash": OWNER_HASH.hex(),
+        "new_owner_hash": NEW_OWNER_HASH.hex(),
+        "fabric_tx_id": "fabric-tx-2",
+    }
+
+
+def _certificate_note(note_format: str) -> bytes:
+    """Build the test certificate note in the given format."""
+    return _title_certificate_note(
+        "MH-PUNE-HAV-001", OWNER_HASH, "fabric-tx-1", DOCUMENT_HASH, note_format
+    )
+
+
+def _transfer_note(note_format: str) -> bytes:
+    """Build the test transfer note in the given format."""
+    return _ownership_transfer_note(
+        ASA_ID, OWNER_HASH, NEW_OWNER_HASH, "fabric-tx-2", note_format
+    )
+
+
+class TestNoteEncoding:
+    """Tests for the JSON and msgpack note builders."""
+
+    def test_certificate_json_matches_baseline(self) -> None:
+        """Verify that certificate JSON notes keep the original bytes."""
+        assert _certificate_note("json") == _baseline_note(_certificate_dict())
+
+    def test_transfer_json_matches_baseline(self) -> None:
+        """Verify that transfer JSON notes keep the original bytes."""
+        assert _transfer_note("json") == _baseline_note(_transfer_dict())
+
+    def test_certificate_msgpack_round_trip(self) -> None:
+        """Verify that a msgpack certificate note decodes to the JSON fields."""
+        note = _certificate_note("msgpack")
+        assert len(note) < len(_certificate_note("json"))
+        assert decode_title_note(note) == _certificate_dict()
+
+    def test_transfer_msgpack_round_trip(self) -> None:
+        """Verify that a msgpack transfer note decodes to the JSON fields."""
+        assert decode_title_note(_transfer_note("msgpack")) == _transfer_dict()
+
+    def test_json_note_decodes(self) -> None:
+        """Verify that JSON notes decode to their metadata dict."""
+        assert decode_title_note(_certificate_note("json")) == _certificate_dict()
+
+
+class TestDecodeTitleNote:
+    """Tests for rejecting notes that are not BhulekhChain notes."""
+
+    @pytest.mark.parametrize(
+        "note",
+        [
+            b'{"standard":"other-v1","type":"TITLE_CERTIFICATE"}',
+            b'{"property_id":"MH-PUNE-HAV-001"}',
+            b"{not json",
+            b"plain text note",
+            b"\x82\xa1s\xa3bh2\xa1t\xa2TC",  # msgpack {"s": "bh2", "t": "TC"}
+            b"\x82\xa1s\xa3bh1\xa1t\xa2XX",  # msgpack {"s": "bh1", "t": "XX"}
+        ],
+    )
+    def test_rejects_foreign_notes(self, note: bytes) -> None:
+        """Verify that unrecognised notes raise ValueError in both formats."""
+        with pytest.raises(ValueError):
+            decode_title_note(note)
+
+
+class _FakeGroup:
+    """Transaction group stand-in that records what it would submit."""
+
+    def __init__(self, algorand: "_FakeAlgorand") -> None:
+        self._algorand = algorand
+        self._txns: list[Any] = []
+
+    def add_asset_create(self, params: Any) -> "_FakeGroup":
+        self._txns.append(params)
+        return self
+
+    def add_asset_transfer(self, params: Any) -> "_FakeGroup":
+        self._txns.append(params)
+        return self
+
+    def send(self) -> SimpleNamespace:
+        ids = self._algorand.assign_ids(len(self._txns))
+        self._algorand.sent_groups.append(self._txns)
+        return SimpleNamespace(
+            confirmations=[{"asset-index": i} for i in ids],
+            tx_ids=[f"tx-{i}" for i in ids],
+        )
+
+
+class _FakeAlgorand:
+    """AlgorandClient stand-in that hands out sequential IDs per transaction."""
+
+    def __init__(self) -> None:
+        self.sent_groups: list[list[Any]] = []
+        self._next_id = 1000
+        self.send = SimpleNamespace(asset_create=self._asset_create)
+
+    def _asset_create(self, params: Any) -> SimpleNamespace:
+        (asset_id,) = self.assign_ids(1)
+        self.sent_groups.append([params])
+        return SimpleNamespace(confirmation={"asset-index": asset_id})
+
+    def assign_ids(self, count: int) -> range:
+        ids = range(self._next_id, self._next_id + count)
+        self._next_id += count
+        return ids
+
+    def new_group(self) -> _FakeGroup:
+        return _FakeGroup(self)
+
+
+def _certificates(count: int) -> list[TitleCertificate]:
+    """Build count distinct test certificates."""
+    return [
+        TitleCertificate(f"MH-PUNE-{i:03}", OWNER_HASH, f"fabric-tx-{i}", DOCUMENT_HASH)
+        for i in range(count)
+    ]
+
+
+class TestBatches:
+    """Tests for the grouped mint and transfer helpers."""
+
+    def test_certificates_split_into_groups(self) -> None:
+        """Verify that certificates are sent in groups of MAX_GROUP_SIZE, in order."""
+        algorand = _FakeAlgorand()
+        certificates = _certificates(2 * MAX_GROUP_SIZE + 1)
+        asset_ids = create_title_certificates_batch(
+            algorand, ANCHOR_ACCOUNT, certificates
+        )
+
+        assert [len(group) for group in algorand.sent_groups] == [16, 16, 1]
+        sent_names = [p.asset_name for group in algorand.sent_groups for p in group]
+        assert sent_names == [f"TITLE-{c.property_id}" for c in certificates]
+        assert asset_ids == list(range(1000, 1000 + len(certificates)))
+
+    def test_transfers_split_into_groups(self) -> None:
+        """Verify that transfers are sent in groups of MAX_GROUP_SIZE, in order."""
+        algorand = _FakeAlgorand()
+        transfers = [
+            TitleTransfer(ASA_ID + i, OWNER_HASH, NEW_OWNER_HASH, f"fabric-tx-{i}")
+            for i in range(MAX_GROUP_SIZE + 1)
+        ]
+        tx_ids = transfer_titles_batch(algorand, ANCHOR_ACCOUNT, transfers)
+
+        assert [len(group) for group in algorand.sent_groups] == [16, 1]
+        sent_asa_ids = [p.asset_id for group in algorand.sent_groups for p in group]
+        assert sent_asa_ids == [t.asa_id for t in transfers]
+        assert tx_ids == [f"tx-{i}" for i in range(1000, 1000 + len(transfers))]
+
+    def test_empty_batches(self) -> None:
+        """Verify that empty input sends nothing and returns no IDs."""
+        algorand = _FakeAlgorand()
+        assert create_title_certificates_batch(algorand, ANCHOR_ACCOUNT, []) == []
+        assert transfer_titles_batch(algorand, ANCHOR_ACCOUNT, []) == []
+        assert algorand.sent_groups == []
+
+    def test_rejects_non_ascii_property_id(self) -> None:
+        """Verify that a non-ASCII property ID is rejected before sending."""
+        with pytest.raises(ValueError, match="ASCII"):
+            create_title_certificate_asa(
+                _FakeAlgorand(),
+                ANCHOR_ACCOUNT,
+                "MH-पुणे-001",
+                OWNER_HASH,
+                "fabric-tx-1",
+                DOCUMENT_HASH,
+            )
+
+    def test_invalid_certificate_sends_nothing(self) -> None:
+        """Verify that a bad certificate in a later group fails before any send."""
+        algorand = _FakeAlgorand()
+        certificates = _certificates(MAX_GROUP_SIZE) + [
+            TitleCertificate("MH-पुणे-001", OWNER_HASH, "fabric-tx-x", DOCUMENT_HASH)
+        ]
+        with pytest.raises(ValueError, match="ASCII"):
+            create_title_certificates_batch(algorand, ANCHOR_ACCOUNT, certificates)
+        assert algorand.sent_groups == []
+
+
+class _SlowFakeAlgorand(_FakeAlgorand):
+    """Fake client whose single mints block briefly, tracking peak concurrency."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.peak_in_flight = 0
+        self.names_by_id: dict[int, str] = {}
+
+    def _asset_create(self, params: Any) -> SimpleNamespace:
+        with self._lock:
+            self._in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self._in_flight)
+        time.sleep(0.02)
+        with self._lock:
+            self._in_flight -= 1
+            result = super()._asset_create(params)
+            self.names_by_id[result.confirmation["asset-index"]] = params.asset_name
+        return result
+
+
+class TestConcurrentMints:
+    """Tests for the bounded concurrent mint helper."""
+
+    def test_bounds_in_flight_mints(self) -> None:
+        """Verify that at most max_concurrency mints run at once, IDs in input order."""
+        algorand = _SlowFakeAlgorand()
+        certificates = _certificates(6)
+        asset_ids = asyncio.run(
+            create_title_certificates_async(
+                algorand, ANCHOR_ACCOUNT, certificates, max_concurrency=2
+            )
+        )
+
+        assert algorand.peak_in_flight == 2
+        assert [algorand.names_by_id[i] for i in asset_ids] == [
+            f"TITLE-{c.property_id}" for c in certificates
+        ]
+
+    @pytest.mark.parametrize("max_concurrency", [0, -1])
+    def test_rejects_non_positive_concurrency(self, max_concurrency: int) -> None:
+        """Verify that a concurrency bound below 1 raises instead of hanging."""
+        with pytest.raises(ValueError, match="max_concurrency"):
+            asyncio.run(
+                create_title_certificates_async(
+                    _FakeAlgorand(),
+                    ANCHOR_ACCOUNT,
+                    _certificates(1),
+                    max_concurrency=max_concurrency,
+                )
+            )
+
+
+def _txn(tx_id: str, sender: str, note: bytes | None) -> dict[str, Any]:
+    """Build an Indexer transaction record for the test ASA."""
+    txn: dict[str, Any] = {
+        "id": tx_id,
+        "confirmed-round": int(tx_id),
+        "sender": sender,
+        "tx-type": "axfer",
+    }
+    if note is not None:
+        txn["note"] = base64.b64encode(note).decode()
+    return txn
+
+
+def _indexer_transport(
+    pages: dict[str | None, dict[str, Any]],
+    requested: list[str | None],
+) -> httpx.MockTransport:
+    """Serve Indexer pages keyed by the request's "next" token."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == f"/v2/assets/{ASA_ID}/transactions"
+        token = request.url.params.get("next")
+        requested.append(token)
+        return httpx.Response(200, json=pages[token])
+
+    return httpx.MockTransport(handler)
+
+
+class TestFetchTitleHistory:
+    """Tests for reading title history from the Indexer."""
+
+    PAGES: Final[dict[str | None, dict[str, Any]]] = {
+        None: {
+            "transactions": [
+                _txn("1", ANCHOR_ACCOUNT, _certificate_note("json")),
+                _txn("2", OTHER_ACCOUNT, _transfer_note("json")),
+            ],
+            "next-token": "page-2",
+        },
+        "page-2": {
+            "transactions": [
+                _txn("3", ANCHOR_ACCOUNT, None),
+                _txn("4", ANCHOR_ACCOUNT, b"not a bhulekhchain note"),
+                _txn("5", ANCHOR_ACCOUNT, _transfer_note("msgpack")),
+            ],
+            "next-token": "page-3",
+        },
+        "page-3": {"transactions": []},
+    }
+
+    def _fetch(self, requested: list[str | None]) -> list[TitleHistoryEntry]:
+        """Fetch the test ASA's history from the mocked Indexer."""
+
+        async def run() -> list[TitleHistoryEntry]:
+            async with httpx.AsyncClient(
+                base_url="http://indexer",
+                transport=_indexer_transport(self.PAGES, requested),
+            ) as client:
+                return await fetch_title_history(client, ASA_ID, ANCHOR_ACCOUNT)
+
+        return asyncio.run(run())
+
+    def test_follows_pagination(self) -> None:
+        """Verify that every page is requested until an empty page."""
+        requested: list[str | None] = []
+        self._fetch(requested)
+        assert requested == [None, "page-2", "page-3"]
+
+    def test_keeps_only_anchor_notes(self) -> None:
+        """Verify that foreign senders, missing notes and junk notes are skipped."""
+        history = self._fetch([])
+        assert history == [
+            TitleHistoryEntry("1", 1, ANCHOR_ACCOUNT, "axfer", _certificate_dict()),
+            TitleHistoryEntry("5", 5, ANCHOR_ACCOUNT, "axfer", _transfer_dict()),
+        ]
+
+    def test_histories_bound_in_flight_lookups(self) -> None:
+        """Verify that at most max_concurrency ASA lookups run at once."""
+        in_flight = 0
+        peak_in_flight = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak_in_flight
+            in_flight += 1
+            peak_in_flight = max(peak_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={"transactions": []})
+
+        async def run() -> dict[int, list[TitleHistoryEntry]]:
+            async with httpx.AsyncClient(
+                base_url="http://indexer", transport=httpx.MockTransport(handler)
+            ) as client:
+                return await fetch_title_histories(
+                    range(10), ANCHOR_ACCOUNT, client, max_concurrency=3
+                )
+
+        assert asyncio.run(run()) == {asa_id: [] for asa_id in range(10)}
+        assert peak_in_flight == 3
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{}, {"client": object(), "indexer_url": "http://indexer"}],
+    )
+    def test_histories_need_one_source(self, kwargs: dict[str, Any]) -> None:
+        """Verify that exactly one of client or indexer_url must be given."""
+        with pytest.raises(ValueError, match="exactly one"):
+            asyncio.run(fetch_title_histories([ASA_ID], ANCHOR_ACCOUNT, **kwargs))
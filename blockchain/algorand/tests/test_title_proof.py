@@ -2,18 +2,33 @@
 Tests for the TitleProofAnchor Algorand smart contract.
 
 These tests use algokit_utils testing utilities with a localnet Algorand
-instance. Each test operates against a freshly deployed contract to ensure
-isolation.
+instance. Contract deployment is the most expensive step, so each test class
+shares one deployed contract. Tests that anchor state assert on counter
+deltas rather than absolute values; tests that need a pristine contract opt
+in to the function-scoped fresh_app fixture.
+
+Calls that a test would otherwise issue back to back are submitted as one
+atomic transaction group (one confirmation wait), and readonly reads are
+simulated. The tests stay synchronous: algokit_utils has no async send
+API, and grouped calls already share a single round-trip.
 
 Prerequisites:
     - algokit localnet must be running: `algokit localnet start`
+      Its algod runs in DevMode by default, producing a block as soon as a
+      transaction (group) is submitted, so confirmations return in
+      milliseconds. A non-dev algod adds a full block interval (~3 s) to
+      every send in this module; if a custom localnet config is in use,
+      make sure it keeps DevMode enabled.
     - Contract must be compiled: `algokit compile py contracts/title_proof.py`
 
 Run with:
     pytest tests/test_title_proof.py -v
+    pytest tests/ -n auto --dist loadscope   # in parallel, one class per worker
 """
 
+import os
 from pathlib import Path
+from typing import Final
 
 import pytest
 from algokit_utils import (
@@ -23,105 +38,176 @@ from algokit_utils import (
     AppFactoryCreateParams,
     LogicError,
 )
+from algokit_utils.applications.app_client import AppClientMethodCallParams
+from algokit_utils.applications.app_factory import AppFactoryParams
+from algokit_utils.transactions import AppCallMethodCallParams
+
+from scripts.deploy import _load_spec
+
+CHANNEL_ID: Final = "land-registry-channel"
+
+# State roots used as anchor payloads, built once at import time.
+STATE_ROOT_ABCDEF: Final[bytes] = b"\xab\xcd\xef" * 10 + b"\x12\x34"
+STATE_ROOT_01: Final[bytes] = b"\x01" * 32
+STATE_ROOT_02: Final[bytes] = b"\x02" * 32
+STATE_ROOT_03: Final[bytes] = b"\x03" * 32
+STATE_ROOT_AA: Final[bytes] = b"\xaa" * 32
+STATE_ROOT_BB: Final[bytes] = b"\xbb" * 32
+STATE_ROOT_FF: Final[bytes] = b"\xff" * 32
+STATE_ROOT_DEAD: Final[bytes] = b"\xde\xad" * 16
+STATE_ROOT_BEEF: Final[bytes] = b"\xbe\xef" * 16
+
+# (state_code, fabric_block_start, fabric_block_end, state_root, tx_count)
+# for a run of consecutive anchors across two states.
+SEQUENTIAL_ANCHORS: Final[tuple[tuple[str, int, int, bytes, int], ...]] = (
+    ("MH", 1, 50, STATE_ROOT_01, 10),
+    ("MH", 51, 100, STATE_ROOT_02, 15),
+    ("DL", 1, 25, STATE_ROOT_03, 5),
+)
 
 
 @pytest.fixture(scope="session")
-def algorand() -> AlgorandClient:
-    """Create an AlgorandClient connected to localnet."""
-    return AlgorandClient.default_localnet()
+def app_spec(app_spec_path: Path) -> str:
+    """
+    Load the compiled application specification once per session.
+
+    AppFactory accepts the spec as a JSON string (a bare str is treated as
+    JSON, not as a path), so the content is read here a single time, through
+    the same cached, compacting loader the deploy script uses.
+    """
+    return _load_spec(str(app_spec_path), app_spec_path.stat().st_mtime_ns)
 
 
 @pytest.fixture(scope="session")
-def app_spec_path() -> Path:
-    """Locate the compiled application specification."""
-    project_root = Path(__file__).parent.parent
-    candidates = [
-        project_root / "artifacts" / "TitleProofAnchor" / "application.json",
-        project_root / "artifacts" / "title_proof" / "TitleProofAnchor.arc32.json",
-        project_root / "artifacts" / "TitleProofAnchor.arc32.json",
-        project_root / "artifacts" / "TitleProofAnchor" / "TitleProofAnchor.arc56.json",
-    ]
-    for candidate in candidates:
-        if candidate.exists():
-            return candidate
+def creator(funder: str) -> str:
+    """
+    Get this worker's funding account as the contract creator.
+
+    Under xdist each worker has its own funding account, so workers never
+    send identical create transactions from a shared sender.
+
+    Returns:
+        The address string of the creator account.
+    """
+    return funder
 
-    pytest.skip(
-        "Compiled application spec not found. "
-        "Run 'algokit compile py contracts/title_proof.py' first."
+
+@pytest.fixture(scope="session")
+def app_factory(
+    algorand: AlgorandClient,
+    app_spec: str,
+    creator: str,
+) -> AppFactory:
+    """
+    Build the TitleProofAnchor AppFactory once per session.
+
+    Constructing the factory parses the app spec; sharing it means every
+    deployment in the session reuses that parse. Compiled programs are
+    cached too: the factory compiles through the session AlgorandClient's
+    AppManager, which memoizes results per TEAL source.
+
+    Deployments deliberately use create rather than the idempotent
+    factory.deploy(): deploy() looks up an existing app by name and would
+    reuse one already initialized by an earlier run, while these tests rely
+    on initialize succeeding exactly once per contract.
+    """
+    return AppFactory(
+        AppFactoryParams(
+            algorand=algorand,
+            app_spec=app_spec,
+            default_sender=creator,
+        )
     )
 
 
-@pytest.fixture
-def creator(algorand: AlgorandClient) -> str:
+def _deploy(factory: AppFactory) -> AppClient:
     """
-    Get the localnet dispenser account as the contract creator.
+    Deploy a new TitleProofAnchor contract instance (bare create).
 
-    Returns:
-        The address string of the creator account.
+    Every create has the same sender, programs and schema, and the session
+    client reuses its suggested params, so a random note keeps each create
+    a distinct transaction; otherwise algod rejects the second deployment
+    as already in the ledger.
     """
-    account = algorand.account.localnet_dispenser()
-    return account.address
+    app_client, _ = factory.send.bare.create(AppFactoryCreateParams(note=os.urandom(8)))
+    return app_client
 
 
-@pytest.fixture
-def authority_account(algorand: AlgorandClient) -> str:
+def _anchor_count(app: AppClient) -> int:
     """
-    Create a funded account to serve as the anchor authority.
+    Read the contract's current anchor counter.
 
-    Returns:
-        The address string of the authority account.
+    get_anchor_count is an ARC-4 readonly method, so algokit_utils simulates
+    the call rather than submitting a transaction.
     """
-    account = algorand.account.random()
-    # Fund the account from the localnet dispenser
-    dispenser = algorand.account.localnet_dispenser()
-    algorand.send.payment(
-        sender=dispenser.address,
-        receiver=account.address,
-        amount=10_000_000,  # 10 ALGO
+    return app.send.call(AppClientMethodCallParams(method="get_anchor_count")).abi_return
+
+
+def _anchor_args(
+    state_code: str,
+    fabric_block_start: int,
+    fabric_block_end: int,
+    state_root: bytes,
+    tx_count: int,
+) -> list[object]:
+    """Build positional anchor_state ABI arguments on the shared channel."""
+    return [
+        state_code,
+        CHANNEL_ID,
+        fabric_block_start,
+        fabric_block_end,
+        state_root,
+        tx_count,
+    ]
+
+
+def _anchor_call(
+    app: AppClient,
+    sender: str,
+    state_code: str,
+    fabric_block_start: int,
+    fabric_block_end: int,
+    state_root: bytes,
+    tx_count: int,
+) -> AppCallMethodCallParams:
+    """Build an anchor_state call for adding to a transaction group."""
+    return app.params.call(
+        AppClientMethodCallParams(
+            method="anchor_state",
+            args=_anchor_args(
+                state_code, fabric_block_start, fabric_block_end, state_root, tx_count
+            ),
+            sender=sender,
+        )
     )
-    return account.address
 
 
-@pytest.fixture
-def unauthorized_account(algorand: AlgorandClient) -> str:
+@pytest.fixture(scope="class")
+def deployed_app(app_factory: AppFactory) -> AppClient:
     """
-    Create a funded account that is NOT the anchor authority.
+    Deploy a TitleProofAnchor contract instance shared by a test class.
 
     Returns:
-        The address string of the unauthorized account.
+        An AppClient connected to the deployed application.
     """
-    account = algorand.account.random()
-    dispenser = algorand.account.localnet_dispenser()
-    algorand.send.payment(
-        sender=dispenser.address,
-        receiver=account.address,
-        amount=10_000_000,  # 10 ALGO
-    )
-    return account.address
+    return _deploy(app_factory)
 
 
 @pytest.fixture
-def deployed_app(
-    algorand: AlgorandClient,
-    app_spec_path: Path,
-    creator: str,
-) -> AppClient:
+def fresh_app(app_factory: AppFactory) -> AppClient:
     """
-    Deploy a fresh TitleProofAnchor contract instance.
+    Deploy an uninitialized contract for a single test.
+
+    Opt-in for tests that need a pristine contract (e.g. an unset authority
+    or a zero anchor counter); everything else shares deployed_app.
 
     Returns:
         An AppClient connected to the newly deployed application.
     """
-    factory = AppFactory(
-        algorand=algorand,
-        app_spec=app_spec_path,
-        default_sender=creator,
-    )
-    app_client, _ = factory.send.create(AppFactoryCreateParams())
-    return app_client
+    return _deploy(app_factory)
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def initialized_app(
     deployed_app: AppClient,
     authority_account: str,
@@ -133,8 +219,10 @@ def initialized_app(
         An AppClient connected to the initialized application.
     """
     deployed_app.send.call(
-        method="initialize",
-        args={"authority": authority_account},
+        AppClientMethodCallParams(
+            method="initialize",
+            args=[authority_account],
+        )
     )
     return deployed_app
 
@@ -144,13 +232,15 @@ class TestInitialize:
 
     def test_initialize_sets_authority(
         self,
-        deployed_app: AppClient,
+        fresh_app: AppClient,
         authority_account: str,
     ) -> None:
         """Verify that the creator can successfully initialize the anchor authority."""
-        result = deployed_app.send.call(
-            method="initialize",
-            args={"authority": authority_account},
+        result = fresh_app.send.call(
+            AppClientMethodCallParams(
+                method="initialize",
+                args=[authority_account],
+            )
         )
         # The call should succeed without error
         assert result is not None
@@ -163,33 +253,27 @@ class TestInitialize:
         """Verify that initialize cannot be called again after the first call."""
         with pytest.raises(LogicError, match="Already initialized"):
             initialized_app.send.call(
-                method="initialize",
-                args={"authority": authority_account},
+                AppClientMethodCallParams(
+                    method="initialize",
+                    args=[authority_account],
+                )
             )
 
     def test_initialize_only_creator(
         self,
-        algorand: AlgorandClient,
-        app_spec_path: Path,
-        creator: str,
+        fresh_app: AppClient,
         unauthorized_account: str,
         authority_account: str,
     ) -> None:
         """Verify that only the contract creator can call initialize."""
-        # Deploy a fresh contract
-        factory = AppFactory(
-            algorand=algorand,
-            app_spec=app_spec_path,
-            default_sender=creator,
-        )
-        app_client, _ = factory.send.create(AppFactoryCreateParams())
-
-        # Try to initialize from a non-creator account
+        # Try to initialize a fresh contract from a non-creator account
         with pytest.raises(LogicError, match="Only creator can initialize"):
-            app_client.send.call(
-                method="initialize",
-                args={"authority": authority_account},
-                sender=unauthorized_account,
+            fresh_app.send.call(
+                AppClientMethodCallParams(
+                    method="initialize",
+                    args=[authority_account],
+                    sender=unauthorized_account,
+                )
             )
 
 
@@ -202,21 +286,17 @@ class TestAnchorState:
         authority_account: str,
     ) -> None:
         """Verify that the anchor authority can successfully anchor a state root."""
+        before = _anchor_count(initialized_app)
         result = initialized_app.send.call(
-            method="anchor_state",
-            args={
-                "state_code": "UP",
-                "channel_id": "land-registry-channel",
-                "fabric_block_start": 100,
-                "fabric_block_end": 200,
-                "state_root": b"\xab\xcd\xef" * 10 + b"\x12\x34",
-                "tx_count": 42,
-            },
-            sender=authority_account,
+            AppClientMethodCallParams(
+                method="anchor_state",
+                args=_anchor_args("UP", 100, 200, STATE_ROOT_ABCDEF, 42),
+                sender=authority_account,
+            )
         )
-        # The return value should be the anchor sequence number (1 for first anchor)
+        # The return value should be the anchor's sequence number
         assert result.abi_return is not None
-        assert result.abi_return == 1
+        assert result.abi_return == before + 1
 
     def test_anchor_state_increments_counter(
         self,
@@ -224,50 +304,20 @@ class TestAnchorState:
         authority_account: str,
     ) -> None:
         """Verify that each anchor call increments the anchor counter."""
-        # First anchor
-        result1 = initialized_app.send.call(
-            method="anchor_state",
-            args={
-                "state_code": "MH",
-                "channel_id": "land-registry-channel",
-                "fabric_block_start": 1,
-                "fabric_block_end": 50,
-                "state_root": b"\x01" * 32,
-                "tx_count": 10,
-            },
-            sender=authority_account,
-        )
-        assert result1.abi_return == 1
-
-        # Second anchor
-        result2 = initialized_app.send.call(
-            method="anchor_state",
-            args={
-                "state_code": "MH",
-                "channel_id": "land-registry-channel",
-                "fabric_block_start": 51,
-                "fabric_block_end": 100,
-                "state_root": b"\x02" * 32,
-                "tx_count": 15,
-            },
-            sender=authority_account,
-        )
-        assert result2.abi_return == 2
+        before = _anchor_count(initialized_app)
+
+        # Submit all anchors as one atomic group: a single confirmation wait
+        # instead of one per anchor, with calls still executed in order.
+        group = initialized_app.algorand.new_group()
+        for anchor in SEQUENTIAL_ANCHORS:
+            group.add_app_call_method_call(
+                _anchor_call(initialized_app, authority_account, *anchor)
+            )
+        result = group.send()
 
-        # Third anchor from a different state
-        result3 = initialized_app.send.call(
-            method="anchor_state",
-            args={
-                "state_code": "DL",
-                "channel_id": "land-registry-channel",
-                "fabric_block_start": 1,
-                "fabric_block_end": 25,
-                "state_root": b"\x03" * 32,
-                "tx_count": 5,
-            },
-            sender=authority_account,
-        )
-        assert result3.abi_return == 3
+        assert [r.value for r in result.returns] == [
+            before + i for i in range(1, len(SEQUENTIAL_ANCHORS) + 1)
+        ]
 
     def test_unauthorized_anchor(
         self,
@@ -277,16 +327,11 @@ class TestAnchorState:
         """Verify that a non-authority account cannot submit anchors."""
         with pytest.raises(LogicError, match="Unauthorized"):
             initialized_app.send.call(
-                method="anchor_state",
-                args={
-                    "state_code": "UP",
-                    "channel_id": "land-registry-channel",
-                    "fabric_block_start": 1,
-                    "fabric_block_end": 10,
-                    "state_root": b"\xff" * 32,
-                    "tx_count": 5,
-                },
-                sender=unauthorized_account,
+                AppClientMethodCallParams(
+                    method="anchor_state",
+                    args=_anchor_args("UP", 1, 10, STATE_ROOT_FF, 5),
+                    sender=unauthorized_account,
+                )
             )
 
 
@@ -295,56 +340,50 @@ class TestRotateAuthority:
 
     def test_rotate_authority_success(
         self,
-        algorand: AlgorandClient,
-        initialized_app: AppClient,
+        fresh_app: AppClient,
         authority_account: str,
+        funded_accounts: dict[str, str],
     ) -> None:
         """Verify that the current authority can rotate to a new authority."""
-        # Create a new account to become the new authority
-        new_authority = algorand.account.random()
-        dispenser = algorand.account.localnet_dispenser()
-        algorand.send.payment(
-            sender=dispenser.address,
-            receiver=new_authority.address,
-            amount=10_000_000,
+        # Rotation is permanent, so this test uses its own contract rather
+        # than changing the authority of the class-shared one. A pre-funded
+        # spare account becomes the new authority.
+        new_authority = funded_accounts["spare"]
+
+        # Initialize, rotate authority and anchor as the new authority in one
+        # atomic group: the anchor only succeeds if the rotation took effect.
+        initialize = fresh_app.params.call(
+            AppClientMethodCallParams(
+                method="initialize",
+                args=[authority_account],
+            )
         )
-
-        # Rotate authority
-        result = initialized_app.send.call(
-            method="rotate_authority",
-            args={"new_authority": new_authority.address},
-            sender=authority_account,
+        rotate = fresh_app.params.call(
+            AppClientMethodCallParams(
+                method="rotate_authority",
+                args=[new_authority],
+                sender=authority_account,
+            )
         )
-        assert result is not None
-
-        # Verify the new authority can anchor
-        anchor_result = initialized_app.send.call(
-            method="anchor_state",
-            args={
-                "state_code": "KA",
-                "channel_id": "land-registry-channel",
-                "fabric_block_start": 1,
-                "fabric_block_end": 10,
-                "state_root": b"\xaa" * 32,
-                "tx_count": 3,
-            },
-            sender=new_authority.address,
+        result = (
+            fresh_app.algorand.new_group()
+            .add_app_call_method_call(initialize)
+            .add_app_call_method_call(rotate)
+            .add_app_call_method_call(
+                _anchor_call(fresh_app, new_authority, "KA", 1, 10, STATE_ROOT_AA, 3)
+            )
+            .send()
         )
-        assert anchor_result.abi_return == 1
+        assert result.returns[-1].value == 1
 
         # Verify the old authority can no longer anchor
         with pytest.raises(LogicError, match="Unauthorized"):
-            initialized_app.send.call(
-                method="anchor_state",
-                args={
-                    "state_code": "KA",
-                    "channel_id": "land-registry-channel",
-                    "fabric_block_start": 11,
-                    "fabric_block_end": 20,
-                    "state_root": b"\xbb" * 32,
-                    "tx_count": 7,
-                },
-                sender=authority_account,
+            fresh_app.send.call(
+                AppClientMethodCallParams(
+                    method="anchor_state",
+                    args=_anchor_args("KA", 11, 20, STATE_ROOT_BB, 7),
+                    sender=authority_account,
+                )
             )
 
     def test_rotate_authority_unauthorized(
@@ -355,9 +394,11 @@ class TestRotateAuthority:
         """Verify that a non-authority account cannot rotate the authority."""
         with pytest.raises(LogicError, match="Unauthorized"):
             initialized_app.send.call(
-                method="rotate_authority",
-                args={"new_authority": unauthorized_account},
-                sender=unauthorized_account,
+                AppClientMethodCallParams(
+                    method="rotate_authority",
+                    args=[unauthorized_account],
+                    sender=unauthorized_account,
+                )
             )
 
 
@@ -366,13 +407,17 @@ class TestGetAnchorCount:
 
     def test_get_anchor_count_initial(
         self,
-        initialized_app: AppClient,
+        fresh_app: AppClient,
+        authority_account: str,
     ) -> None:
         """Verify that the anchor count starts at zero after initialization."""
-        result = initialized_app.send.call(
-            method="get_anchor_count",
+        fresh_app.send.call(
+            AppClientMethodCallParams(
+                method="initialize",
+                args=[authority_account],
+            )
         )
-        assert result.abi_return == 0
+        assert _anchor_count(fresh_app) == 0
 
     def test_get_anchor_count_after_anchoring(
         self,
@@ -380,34 +425,21 @@ class TestGetAnchorCount:
         authority_account: str,
     ) -> None:
         """Verify that get_anchor_count returns the correct count after anchoring."""
-        # Submit two anchors
-        initialized_app.send.call(
-            method="anchor_state",
-            args={
-                "state_code": "RJ",
-                "channel_id": "land-registry-channel",
-                "fabric_block_start": 1,
-                "fabric_block_end": 50,
-                "state_root": b"\xde\xad" * 16,
-                "tx_count": 20,
-            },
-            sender=authority_account,
-        )
-        initialized_app.send.call(
-            method="anchor_state",
-            args={
-                "state_code": "RJ",
-                "channel_id": "land-registry-channel",
-                "fabric_block_start": 51,
-                "fabric_block_end": 100,
-                "state_root": b"\xbe\xef" * 16,
-                "tx_count": 30,
-            },
-            sender=authority_account,
+        before = _anchor_count(initialized_app)
+
+        # Submit two anchors as one atomic group
+        (
+            initialized_app.algorand.new_group()
+            .add_app_call_method_call(
+                _anchor_call(initialized_app, authority_account, "RJ", 1, 50, STATE_ROOT_DEAD, 20)
+            )
+            .add_app_call_method_call(
+                _anchor_call(
+                    initialized_app, authority_account, "RJ", 51, 100, STATE_ROOT_BEEF, 30
+                )
+            )
+            .send()
         )
 
         # Check the count
-        result = initialized_app.send.call(
-            method="get_anchor_count",
-        )
-        assert result.abi_return == 2
+        assert _anchor_count(initialized_app) == before + 2